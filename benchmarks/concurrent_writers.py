@@ -0,0 +1,113 @@
+"""Concurrent-writer load test against a local SQLite file database.
+
+Starts several threads that each log in as a different teacher and submit
+grade batches (or, with --workload attendance, whole-class roll calls) through
+the Flask test client at the same time, then reports throughput, latency and
+how many requests failed with a locked database.
+
+    python -m benchmarks.concurrent_writers --writers 16 --batches 50
+    python -m benchmarks.concurrent_writers --workload attendance --batches 200
+"""
+import argparse
+import datetime
+import os
+import statistics
+import tempfile
+import threading
+import time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workload', choices=('grades', 'attendance'), default='grades')
+    parser.add_argument('--writers', type=int, default=16, help='concurrent teachers submitting grades')
+    parser.add_argument('--batches', type=int, default=50, help='grade batches or roll calls submitted per writer')
+    parser.add_argument('--students', type=int, default=30, help="students in each writer's class")
+    parser.add_argument('--courses', type=int, default=4)
+    parser.add_argument('--database', help='SQLite file to use (default: a temporary file)')
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    path = os.path.abspath(args.database or os.path.join(directory, 'load.db'))
+    os.environ['FLASK_SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + path
+
+    # The app is built after the database URL is set above, so it picks it up
+    from werkzeug.security import generate_password_hash
+    from app import create_app, db, User, Teacher, Class, Student, Course, Enrollment
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+        password = generate_password_hash('load-test')
+        courses = [Course(name=f'Course {c}') for c in range(args.courses)]
+        db.session.add_all(courses)
+        for writer in range(args.writers):
+            user = User(first_name='Load', last_name=f'Teacher {writer}', email=f'load{writer}@example.com',
+                        password=password, role='Teacher')
+            teacher = Teacher(user=user)
+            class_ = Class(name=f'Load class {writer}', teacher=teacher)
+            db.session.add(class_)
+            for number in range(args.students):
+                student = Student(admission_number=f'L{writer}-{number}', name=f'Pupil {number}', class_=class_)
+                db.session.add_all(Enrollment(student=student, course=course) for course in courses)
+        db.session.commit()
+        journal_mode = db.session.execute(db.text('PRAGMA journal_mode')).scalar()
+
+    latencies, statuses = [], []
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(args.writers)
+
+    def writer(number):
+        client = app.test_client()
+        client.post('/login', data={'email': f'load{number}@example.com', 'password': 'load-test'})
+        with app.app_context():
+            teacher = Teacher.query.join(User).filter(User.email == f'load{number}@example.com').one()
+            cells = [(student.id, course_id) for student in teacher.classes[0].students
+                     for course_id in range(1, args.courses + 1)]
+            class_id = teacher.classes[0].id
+            student_ids = sorted({student_id for student_id, _ in cells})
+        periods = app.config['ATTENDANCE_PERIODS']
+        start_barrier.wait()
+        for batch in range(args.batches):
+            if args.workload == 'attendance':
+                # Every period of consecutive days, with one student in seven absent
+                day = datetime.date(2026, 1, 5) + datetime.timedelta(days=batch // periods)
+                payload = {'class_id': class_id, 'date': day.isoformat(), 'period': batch % periods + 1,
+                           'marks': [{'student_id': student_id, 'status': 'A' if (batch + student_id) % 7 == 0 else 'P'}
+                                     for student_id in student_ids]}
+                url = '/take_attendance'
+            else:
+                payload = {'grades': [{'student_id': student_id, 'course_id': course_id,
+                                       'grade': (batch * 7 + student_id) % 101} for student_id, course_id in cells]}
+                url = '/add_grades'
+            started = time.perf_counter()
+            response = client.post(url, json=payload)
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies.append(elapsed)
+                statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=writer, args=(number,)) for number in range(args.writers)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    failed = sum(1 for status in statuses if status != 200)
+    print(f'database: {path} (journal_mode={journal_mode})')
+    if args.workload == 'attendance':
+        print(f'{len(statuses)} roll calls of {args.students} students from {args.writers} writers in {elapsed:.2f} s '
+              f'({len(statuses) / elapsed * 60:.0f} roll calls/min)')
+    else:
+        print(f'{len(statuses)} batches of {args.students * args.courses} grades from {args.writers} writers '
+              f'in {elapsed:.2f} s ({len(statuses) / elapsed:.1f} batches/s)')
+    print(f'latency p50 {statistics.median(latencies) * 1000:.1f} ms, '
+          f'p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms')
+    print(f'failed requests: {failed}')
+
+
+if __name__ == '__main__':
+    main()
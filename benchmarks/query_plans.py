@@ -0,0 +1,122 @@
+"""Show SQLite query plans and timings for the hot lookups, without and with indexes.
+
+Builds a synthetic school in a temporary SQLite file, runs every lookup the
+routes depend on with the indexes from the hot-lookup migration dropped, then
+again with them created, and prints EXPLAIN QUERY PLAN output and timings.
+
+    python -m benchmarks.query_plans --students 100000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine, text
+
+from app import db
+
+from benchmarks.synthetic import generate_school
+
+# (label, SQL, function picking parameters for one run from sampled ids)
+QUERIES = [
+    ('teacher by user_id', 'SELECT * FROM teacher WHERE user_id = :user_id',
+     lambda ids: {'user_id': random.choice(ids['teacher_user'])}),
+    ('parent by user_id', 'SELECT * FROM parent WHERE user_id = :user_id',
+     lambda ids: {'user_id': random.choice(ids['parent_user'])}),
+    ('students by class_id', 'SELECT * FROM student WHERE class_id = :class_id',
+     lambda ids: {'class_id': random.choice(ids['class'])}),
+    ('students by parent_id', 'SELECT * FROM student WHERE parent_id = :parent_id',
+     lambda ids: {'parent_id': random.choice(ids['parent'])}),
+    ('association request pair',
+     'SELECT * FROM association_request WHERE parent_id = :parent_id AND student_id = :student_id',
+     lambda ids: dict(zip(('parent_id', 'student_id'), random.choice(ids['request_pair'])))),
+    ('pending request page for teacher',
+     'SELECT association_request.* FROM association_request '
+     "WHERE association_request.status = 'pending' AND association_request.student_id IN ("
+     'SELECT student.id FROM student JOIN class ON student.class_id = class.id '
+     'WHERE class.teacher_id = :teacher_id) ORDER BY association_request.id LIMIT 51',
+     lambda ids: {'teacher_id': random.choice(ids['teacher'])}),
+    ('enrollment by student and course',
+     'SELECT * FROM enrollment WHERE student_id = :student_id AND course_id = :course_id',
+     lambda ids: dict(zip(('student_id', 'course_id'), random.choice(ids['enrollment_pair'])))),
+    ('grades by enrollment_id', 'SELECT * FROM grade WHERE enrollment_id = :enrollment_id',
+     lambda ids: {'enrollment_id': random.choice(ids['enrollment'])}),
+]
+
+SAMPLES = {
+    'teacher_user': 'SELECT user_id FROM teacher',
+    'parent_user': 'SELECT user_id FROM parent',
+    'class': 'SELECT id FROM class',
+    'parent': 'SELECT id FROM parent',
+    'teacher': 'SELECT id FROM teacher',
+    'request_pair': 'SELECT parent_id, student_id FROM association_request',
+    'enrollment_pair': 'SELECT student_id, course_id FROM enrollment',
+    'enrollment': 'SELECT id FROM enrollment',
+}
+
+
+def hot_lookup_indexes():
+    # Indexes declared on the models, excluding the implicit ones SQLite adds for UNIQUE columns
+    return [index for table in db.metadata.sorted_tables for index in table.indexes]
+
+
+def sample_ids(engine, size=1000):
+    # A random sample of existing keys per lookup, so every timed query finds real rows
+    with engine.connect() as conn:
+        return {name: [tuple(row) if len(row) > 1 else row[0]
+                       for row in conn.execute(text(f'{sql} ORDER BY random() LIMIT {size}'))]
+                for name, sql in SAMPLES.items()}
+
+
+def report(engine, ids, runs):
+    with engine.connect() as conn:
+        for label, sql, make_params in QUERIES:
+            params = make_params(ids)
+            plan = [row[-1] for row in conn.execute(text('EXPLAIN QUERY PLAN ' + sql), params)]
+            started = time.perf_counter()
+            for _ in range(runs):
+                conn.execute(text(sql), make_params(ids)).fetchall()
+            elapsed_ms = (time.perf_counter() - started) * 1000 / runs
+            print(f'  {label:<34} {elapsed_ms:9.3f} ms   ' + ' | '.join(plan))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--students', type=int, default=100000)
+    parser.add_argument('--students-per-class', type=int, default=35)
+    parser.add_argument('--courses', type=int, default=5)
+    parser.add_argument('--runs', type=int, default=50, help='timed executions per query')
+    args = parser.parse_args()
+
+    classes = max(1, args.students // args.students_per_class)
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine('sqlite:///' + os.path.join(directory, 'bench.db'))
+        db.metadata.create_all(engine)
+        indexes = hot_lookup_indexes()
+        for index in indexes:
+            index.drop(engine)
+
+        print(f"Populating {classes * args.students_per_class} students in {classes} classes "
+              f"with {args.courses} courses each...")
+        with engine.begin() as conn:
+            generate_school(conn, classes=classes, students_per_class=args.students_per_class, courses=args.courses)
+            conn.execute(text('ANALYZE'))
+        ids = sample_ids(engine)
+
+        print('\nWithout indexes:')
+        report(engine, ids, args.runs)
+
+        for index in indexes:
+            index.create(engine)
+        with engine.begin() as conn:
+            conn.execute(text('ANALYZE'))
+
+        print('\nWith indexes:')
+        report(engine, ids, args.runs)
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,239 @@
+"""Route benchmark suite: every page and API endpoint against a synthetic school.
+
+Builds a school with the seeded generator in a temporary SQLite file, logs in
+one test client per role and requests each route several times, reporting
+p50/p95 latency, SQL statements and peak Python memory per request. Results
+can be saved as JSON and compared with an earlier run to catch regressions.
+
+    python -m benchmarks.routes --classes 50 --json before.json
+    python -m benchmarks.routes --classes 50 --compare before.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+PASSWORD = 'benchmark'
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def build_cases(app, db, models):
+    """Return (role, label, endpoint, method, url, kwargs) for every route the suite drives."""
+    User, Teacher, Parent, Student, Class, Course, AssociationRequest = models
+
+    with app.app_context():
+        admin = User.query.filter_by(role='Admin').order_by(User.id).first()
+        # The busiest teacher and parent, so their pages are the slowest ones
+        teacher = Teacher.query.join(Class).group_by(Teacher.id).order_by(db.func.count(Class.id).desc()).first()
+        parent = Parent.query.join(Student).group_by(Parent.id).order_by(db.func.count(Student.id).desc()).first()
+        # A child the parent may open, i.e. one whose association request was accepted
+        accepted = [request.student for request in parent.association_requests if request.status == 'accepted']
+        class_ = teacher.classes[0]
+        student = class_.students[0]
+        child = accepted[0] if accepted else parent.students[0]
+        course_ids = [course.id for course in Course.query.order_by(Course.id)]
+        grades = {'grades': [{'student_id': pupil.id, 'course_id': course_id, 'grade': 75}
+                             for pupil in class_.students for course_id in course_ids]}
+        roll_call = {'class_id': class_.id, 'date': '2026-01-05', 'period': 1,
+                     'marks': [{'student_id': pupil.id, 'status': 'P'} for pupil in class_.students]}
+        last_request_id = db.session.query(db.func.max(AssociationRequest.id)).scalar()
+        logins = {'admin': admin.email, 'teacher': teacher.user.email, 'parent': parent.user.email}
+
+    cases = [
+        ('anonymous', 'home', 'home', 'GET', '/', {}),
+        ('anonymous', 'login form', 'login', 'GET', '/login', {}),
+        ('anonymous', 'register form', 'register', 'GET', '/register', {}),
+        ('anonymous', 'liveness probe', 'healthz', 'GET', '/healthz', {}),
+        ('anonymous', 'readiness probe', 'readyz', 'GET', '/readyz', {}),
+        ('admin', 'dashboard', 'dashboard', 'GET', '/dashboard', {}),
+        ('admin', 'admin dashboard', 'admin_dashboard', 'GET', '/admin_dashboard', {}),
+        ('admin', 'manage users', 'manage_users', 'GET', '/manage_users', {}),
+        ('admin', 'manage courses', 'manage_courses', 'GET', '/manage_courses', {}),
+        ('admin', 'manage classes', 'manage_classes', 'GET', '/manage_classes', {}),
+        ('admin', 'add course form', 'add_course', 'GET', '/add_course', {}),
+        ('admin', 'add class form', 'add_class', 'GET', '/add_class', {}),
+        ('admin', 'add student form', 'add_student', 'GET', '/add_student', {}),
+        ('admin', 'import students form', 'import_students_view', 'GET', '/import_students', {}),
+        ('admin', 'all students', 'view_all_students', 'GET', '/view_all_students', {}),
+        ('admin', 'class students', 'view_class_students', 'GET', f'/view_class_students/{class_.id}', {}),
+        ('admin', 'class timetable', 'manage_timetable', 'GET', f'/manage_timetable/{class_.id}', {}),
+        ('admin', 'student details', 'view_student_details', 'GET', f'/view_student_details/{student.id}', {}),
+        ('admin', 'export roster (csv)', 'export_roster', 'GET', '/export/roster', {}),
+        ('admin', 'export gradebook (xlsx)', 'export_gradebook', 'GET', '/export/gradebook?format=xlsx', {}),
+        ('admin', 'export association requests', 'export_association_requests', 'GET',
+         '/export/association_requests', {}),
+        ('admin', 'search (prefix)', 'search', 'GET', f'/search?q={student.name.split()[0][:3]}', {}),
+        ('admin', 'search (typo)', 'search', 'GET', f'/search?q={student.name.split()[0][1:]}x', {}),
+        ('admin', 'cache stats', 'cache_stats', 'GET', '/cache_stats', {}),
+        ('admin', 'metrics', 'metrics_view', 'GET', '/metrics', {}),
+        ('admin', 'metric profiles', 'profiles_view', 'GET', '/metrics/profiles', {}),
+        ('admin', 'api students', 'api_students', 'GET', '/api/v1/students', {}),
+        ('admin', 'api student', 'api_student', 'GET', f'/api/v1/students/{student.id}', {}),
+        ('admin', 'api student summary', 'api_student_summary', 'GET', f'/api/v1/students/{student.id}/summary', {}),
+        ('admin', 'api student attendance', 'api_student_attendance', 'GET',
+         f'/api/v1/students/{student.id}/attendance?to=2026-01-05', {}),
+        ('admin', 'api classes', 'api_classes', 'GET', '/api/v1/classes', {}),
+        ('admin', 'api class', 'api_class', 'GET', f'/api/v1/classes/{class_.id}', {}),
+        ('admin', 'api class summary', 'api_class_summary', 'GET', f'/api/v1/classes/{class_.id}/summary', {}),
+        ('admin', 'api class attendance', 'api_class_attendance', 'GET',
+         f'/api/v1/classes/{class_.id}/attendance?date=2026-01-05', {}),
+        ('admin', 'api enrollments', 'api_enrollments', 'GET', '/api/v1/enrollments', {}),
+        ('admin', 'api grades', 'api_grades', 'GET', '/api/v1/grades', {}),
+        ('admin', 'api association requests', 'api_association_requests', 'GET', '/api/v1/association_requests', {}),
+        ('teacher', 'teacher dashboard', 'teacher_dashboard', 'GET', '/teacher_dashboard', {}),
+        ('teacher', 'view students', 'view_students', 'GET', '/view_students', {}),
+        ('teacher', 'association requests', 'view_and_manage_association_requests', 'GET',
+         '/view_and_manage_association_requests', {}),
+        ('teacher', 'accept association requests (all)', 'view_and_manage_association_requests', 'POST',
+         '/view_and_manage_association_requests', {'data': {'action': 'accept', 'scope': 'all', 'through_id': last_request_id}}),
+        ('teacher', 'add grades form', 'add_grades', 'GET', '/add_grades', {}),
+        ('teacher', 'add grades (class batch)', 'add_grades', 'POST', '/add_grades', {'json': grades}),
+        ('teacher', 'roll call form', 'take_attendance', 'GET', '/take_attendance?date=2026-01-05', {}),
+        ('teacher', 'roll call (class)', 'take_attendance', 'POST', '/take_attendance', {'json': roll_call}),
+        ('admin', 'api job', 'api_job', 'GET', '/api/v1/jobs/1', {}),
+        ('parent', 'parent dashboard', 'parent_dashboard', 'GET', '/parent_dashboard', {}),
+        ('parent', 'child details', 'child_details', 'GET', f'/child_details/{child.id}', {}),
+        ('parent', 'api parent dashboard', 'api_parent_dashboard', 'GET', '/api/v1/parent/dashboard', {}),
+        ('parent', 'send association request', 'send_association_request', 'POST', '/send_association_request',
+         {'data': {'student_admission_number': child.admission_number}}),
+        ('parent', 'logout', 'logout', 'GET', '/logout', {}),
+    ]
+    return logins, cases
+
+
+def run(args):
+    directory = tempfile.mkdtemp()
+    os.environ['FLASK_SQLALCHEMY_DATABASE_URI'] = 'sqlite:///' + os.path.join(directory, 'routes.db')
+    os.environ.setdefault('FLASK_RESPONSE_CACHE_ENABLED', 'true' if args.cache else 'false')
+    # Background job workers would add their own statements to the per-request counts
+    os.environ.setdefault('FLASK_JOBS_WORKERS', '0')
+
+    # The app is built after the settings above are in the environment, so it picks them up
+    from sqlalchemy import event
+    from werkzeug.security import generate_password_hash
+    from app import create_app, db, rebuild_grade_summaries, User, Teacher, Parent, Student, Class, Course
+    from app import AssociationRequest
+    from flask_migrate import stamp
+    from benchmarks.synthetic import generate_school
+
+    app = create_app()
+
+    with app.app_context():
+        db.create_all()
+        # create_all builds the latest schema, so record it as migrated for the readiness probe
+        stamp()
+        password_hash = generate_password_hash(PASSWORD, app.config['PASSWORD_HASH_METHOD'])
+        with db.engine.begin() as connection:
+            counts = generate_school(connection, classes=args.classes, students_per_class=args.students_per_class,
+                                     courses=args.courses, password_hash=password_hash, seed=args.seed)
+        rebuild_grade_summaries()
+        engine = db.engine
+    counts.pop('first_ids')
+    print('School: ' + ', '.join(f'{count} {name}' for name, count in counts.items()))
+
+    logins, cases = build_cases(app, db, (User, Teacher, Parent, Student, Class, Course, AssociationRequest))
+    clients = {'anonymous': app.test_client()}
+    for role, email in logins.items():
+        clients[role] = app.test_client()
+        clients[role].post('/login', data={'email': email, 'password': PASSWORD})
+
+    statements = [0]
+
+    def count_statement(*_):
+        statements[0] += 1
+
+    event.listen(engine, 'before_cursor_execute', count_statement)
+
+    results = {}
+    for role, label, endpoint, method, url, kwargs in cases:
+        client = clients[role]
+        latencies, queries = [], []
+        # The last request runs under tracemalloc, which is too slow to leave on for the timed ones
+        for number in range(args.warmup + args.runs + 1):
+            if endpoint == 'logout':
+                client.post('/login', data={'email': logins[role], 'password': PASSWORD})
+            traced = number == args.warmup + args.runs
+            if traced:
+                tracemalloc.start()
+            statements[0] = 0
+            started = time.perf_counter()
+            response = client.open(url, method=method, **kwargs)
+            # Streamed responses are only produced while the body is read
+            response.get_data()
+            response.close()
+            elapsed = time.perf_counter() - started
+            if traced:
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            elif number >= args.warmup:
+                latencies.append(elapsed * 1000)
+                queries.append(statements[0])
+        results[f'{role} {label}'] = {
+            'endpoint': endpoint,
+            'status': response.status_code,
+            'p50_ms': statistics.median(latencies),
+            'p95_ms': percentile(latencies, 0.95),
+            'queries': max(queries),
+            'peak_kib': peak / 1024,
+        }
+
+    event.remove(engine, 'before_cursor_execute', count_statement)
+
+    covered = {case[2] for case in cases} | {'static'}
+    missing = sorted({rule.endpoint for rule in app.url_map.iter_rules()} - covered)
+    return counts, results, missing
+
+
+def print_report(results, previous=None):
+    print(f"\n{'route':<44} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8} {'peak KiB':>9}")
+    for name, result in results.items():
+        line = (f"{name:<44} {result['status']:>6} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                f"{result['queries']:>8} {result['peak_kib']:>9.0f}")
+        before = (previous or {}).get(name)
+        if before:
+            change = (result['p50_ms'] - before['p50_ms']) / before['p50_ms'] * 100 if before['p50_ms'] else 0
+            line += f"   p50 {change:+6.1f}%"
+            if result['queries'] != before['queries']:
+                line += f"   queries {before['queries']} -> {result['queries']}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--classes', type=int, default=20)
+    parser.add_argument('--students-per-class', type=int, default=30)
+    parser.add_argument('--courses', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--runs', type=int, default=20, help='timed requests per route')
+    parser.add_argument('--warmup', type=int, default=2, help='untimed requests per route before timing')
+    parser.add_argument('--cache', action='store_true', help='leave the response cache on (off by default)')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='compare with results previously written by --json')
+    args = parser.parse_args()
+
+    counts, results, missing = run(args)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as file:
+            previous = json.load(file)['routes']
+    print_report(results, previous)
+
+    if missing:
+        print('\nWarning: routes not covered by the suite: ' + ', '.join(missing), file=sys.stderr)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({'school': counts, 'options': vars(args), 'routes': results}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""Seeded generator of realistic synthetic schools.
+
+Writes users, admins, teachers, parents, classes, courses, students,
+enrollments, grades and association requests with bulk inserts, one class at
+a time so memory stays flat at any scale. The same seed always produces the
+same school.
+
+    python -m benchmarks.synthetic school.db --classes 100 --students-per-class 35
+"""
+import argparse
+import random
+
+from sqlalchemy import create_engine, func, select
+
+from app import db
+
+FIRST_NAMES = [
+    'Amina', 'Brian', 'Chloe', 'David', 'Esther', 'Faith', 'George', 'Hannah', 'Ian', 'Joy', 'Kevin', 'Lucy',
+    'Mercy', 'Nathan', 'Olivia', 'Peter', 'Queen', 'Ruth', 'Samuel', 'Teresa', 'Umar', 'Victor', 'Wanjiru', 'Yusuf',
+]
+LAST_NAMES = [
+    'Achieng', 'Baraka', 'Cheruiyot', 'Duncan', 'Evans', 'Fraser', 'Githinji', 'Hassan', 'Ibrahim', 'Jones',
+    'Kamau', 'Langat', 'Mwangi', 'Njoroge', 'Otieno', 'Patel', 'Quinn', 'Rotich', 'Smith', 'Wafula',
+]
+SUBJECTS = [
+    'Mathematics', 'English', 'Kiswahili', 'Biology', 'Chemistry', 'Physics', 'History', 'Geography',
+    'Computer Studies', 'Business Studies', 'Art', 'Music', 'French', 'Religious Education',
+]
+REQUEST_STATUSES = (('accepted', 0.6), ('pending', 0.3), ('declined', 0.1))
+
+
+def next_id(connection, table):
+    return (connection.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def generate_school(connection, classes=20, students_per_class=30, courses=8, grades_per_enrollment=1,
+                    parent_share=0.7, admins=2, password_hash='!', seed=1):
+    """Populate the database behind `connection` and return the number of rows written per table.
+
+    Every student is enrolled in every course. `parent_share` of the students get a
+    parent (with one to three siblings each) and an association request for each child.
+    All users share `password_hash`, so pass a real hash to be able to log in.
+    """
+    rng = random.Random(seed)
+    tables = db.metadata.tables
+    counts = dict.fromkeys(['user', 'admin', 'teacher', 'parent', 'class', 'course', 'student',
+                            'enrollment', 'grade', 'association_request'], 0)
+    ids = {name: next_id(connection, tables[name]) for name in counts}
+    first_ids = dict(ids)
+
+    def insert(name, rows):
+        if rows:
+            connection.execute(tables[name].insert(), rows)
+            counts[name] += len(rows)
+
+    def new_user(role, first_name, last_name):
+        user_id = ids['user']
+        ids['user'] += 1
+        return {'id': user_id, 'first_name': first_name, 'last_name': last_name, 'role': role,
+                'email': f'{first_name.lower()}.{last_name.lower()}.{user_id}@example.school',
+                'password': password_hash}
+
+    # Staff and courses
+    users, admin_rows = [], []
+    for _ in range(admins):
+        user = new_user('Admin', rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES))
+        users.append(user)
+        admin_rows.append({'id': ids['admin'], 'user_id': user['id']})
+        ids['admin'] += 1
+
+    teacher_rows = []
+    for _ in range(classes):
+        user = new_user('Teacher', rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES))
+        users.append(user)
+        teacher_rows.append({'id': ids['teacher'], 'user_id': user['id'], 'subject_taught': rng.choice(SUBJECTS)})
+        ids['teacher'] += 1
+    insert('user', users)
+    insert('admin', admin_rows)
+    insert('teacher', teacher_rows)
+
+    course_ids = []
+    course_rows = []
+    for number in range(courses):
+        name = SUBJECTS[number % len(SUBJECTS)] + ('' if number < len(SUBJECTS) else f' {number // len(SUBJECTS) + 1}')
+        course_rows.append({'id': ids['course'], 'name': name})
+        course_ids.append(ids['course'])
+        ids['course'] += 1
+    insert('course', course_rows)
+
+    # Classes, one at a time: students, their parents, enrollments, grades and requests
+    for number, teacher in enumerate(teacher_rows):
+        class_id = ids['class']
+        ids['class'] += 1
+        insert('class', [{'id': class_id, 'name': f'Form {number // 4 + 1}{"ABCD"[number % 4]}',
+                          'teacher_id': teacher['id']}])
+
+        users, parents, students, enrollments, grades, requests = [], [], [], [], [], []
+        student_ids = list(range(ids['student'], ids['student'] + students_per_class))
+        ids['student'] += students_per_class
+        parent_of = {}
+
+        remaining = [student_id for student_id in student_ids if rng.random() < parent_share]
+        while remaining:
+            siblings = remaining[:rng.randint(1, 3)]
+            remaining = remaining[len(siblings):]
+            user = new_user('Parent', rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES))
+            users.append(user)
+            parents.append({'id': ids['parent'], 'user_id': user['id'], 'class_id': None})
+            for student_id in siblings:
+                parent_of[student_id] = (ids['parent'], user['last_name'])
+            ids['parent'] += 1
+
+        for student_id in student_ids:
+            parent_id, family_name = parent_of.get(student_id, (None, rng.choice(LAST_NAMES)))
+            status = None
+            if parent_id is not None:
+                status = rng.choices([s for s, _ in REQUEST_STATUSES], [w for _, w in REQUEST_STATUSES])[0]
+                requests.append({'id': ids['association_request'], 'parent_id': parent_id,
+                                 'student_id': student_id, 'status': status})
+                ids['association_request'] += 1
+            students.append({'id': student_id, 'admission_number': f'ADM{student_id:07d}',
+                             'name': f'{rng.choice(FIRST_NAMES)} {family_name}', 'class_id': class_id,
+                             'parent_id': parent_id if status in ('accepted', 'pending') else None})
+
+            # Each pupil has a general ability; course grades scatter around it
+            ability = rng.gauss(62, 12)
+            for course_id in course_ids:
+                enrollment_id = ids['enrollment']
+                ids['enrollment'] += 1
+                enrollments.append({'id': enrollment_id, 'student_id': student_id, 'course_id': course_id})
+                for _ in range(grades_per_enrollment):
+                    grades.append({'id': ids['grade'], 'enrollment_id': enrollment_id,
+                                   'grade': round(min(100.0, max(0.0, rng.gauss(ability, 10))), 1)})
+                    ids['grade'] += 1
+
+        insert('user', users)
+        insert('parent', parents)
+        insert('student', students)
+        insert('enrollment', enrollments)
+        insert('grade', grades)
+        insert('association_request', requests)
+
+    counts['first_ids'] = first_ids
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('database', help='SQLite file to create or extend')
+    parser.add_argument('--classes', type=int, default=20)
+    parser.add_argument('--students-per-class', type=int, default=30)
+    parser.add_argument('--courses', type=int, default=8)
+    parser.add_argument('--grades-per-enrollment', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    engine = create_engine('sqlite:///' + args.database)
+    db.metadata.create_all(engine)
+    with engine.begin() as connection:
+        counts = generate_school(connection, classes=args.classes, students_per_class=args.students_per_class,
+                                 courses=args.courses, grades_per_enrollment=args.grades_per_enrollment,
+                                 seed=args.seed)
+    counts.pop('first_ids')
+    print(', '.join(f'{count} {name}' for name, count in counts.items()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""Gunicorn settings for serving AcademeX in production.
+
+    gunicorn -c gunicorn.conf.py 'app:create_app()'
+
+The app is built once in the master and forked into every worker, so workers
+start without re-importing anything. WEB_CONCURRENCY sets the number of worker
+processes and GUNICORN_THREADS the request threads in each of them.
+"""
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_class = 'gthread'
+preload_app = True
+
+# The local response cache lives inside each worker, and a write only invalidates the
+# pages cached by the worker that made it; the other workers would keep serving their
+# stale copies until the TTL runs out. Several workers therefore need the shared redis
+# backend, and without it the page cache is turned off before the app is loaded.
+if workers > 1 and os.environ.get('FLASK_RESPONSE_CACHE_BACKEND', 'local') != 'redis':
+    os.environ['FLASK_RESPONSE_CACHE_ENABLED'] = 'false'
+
+timeout = 30  # Seconds a silent worker is given before the master kills and replaces it
+graceful_timeout = 30  # Seconds a worker has to finish its requests on reload or shutdown
+keepalive = 5
+
+# Replace each worker after a while so slow leaks cannot build up; the jitter keeps them from restarting together
+max_requests = 5000
+max_requests_jitter = 500
+
+accesslog = '-'
+
+
+def worker_exit(server, worker):
+    # Let a job that is already running finish before the worker goes away
+    from app import job_queue
+    job_queue.stop()
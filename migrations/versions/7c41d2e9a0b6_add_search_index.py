@@ -0,0 +1,51 @@
+"""add search index
+
+Revision ID: 7c41d2e9a0b6
+Revises: 1b93536d60f4
+Create Date: 2026-10-18 15:12:08.214530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c41d2e9a0b6'
+down_revision = '1b93536d60f4'
+branch_labels = None
+depends_on = None
+
+
+# FTS5 index over student, user and class names, kept in sync by triggers (SQLite only)
+STATEMENTS = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5(title, detail, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3 4')",
+    'DELETE FROM search_index',
+    'INSERT INTO search_index (rowid, title, detail) SELECT id * 4 + 0, "student".name, "student".admission_number FROM "student"',
+    'CREATE TRIGGER IF NOT EXISTS student_search_insert AFTER INSERT ON "student" BEGIN INSERT INTO search_index (rowid, title, detail) VALUES (new.id * 4 + 0, new.name, new.admission_number); END',
+    'CREATE TRIGGER IF NOT EXISTS student_search_update AFTER UPDATE OF name, admission_number ON "student" BEGIN DELETE FROM search_index WHERE rowid = old.id * 4 + 0; INSERT INTO search_index (rowid, title, detail) VALUES (new.id * 4 + 0, new.name, new.admission_number); END',
+    'CREATE TRIGGER IF NOT EXISTS student_search_delete AFTER DELETE ON "student" BEGIN DELETE FROM search_index WHERE rowid = old.id * 4 + 0; END',
+    'INSERT INTO search_index (rowid, title, detail) SELECT id * 4 + 1, "user".first_name || \' \' || "user".last_name, "user".email FROM "user"',
+    'CREATE TRIGGER IF NOT EXISTS user_search_insert AFTER INSERT ON "user" BEGIN INSERT INTO search_index (rowid, title, detail) VALUES (new.id * 4 + 1, new.first_name || \' \' || new.last_name, new.email); END',
+    'CREATE TRIGGER IF NOT EXISTS user_search_update AFTER UPDATE OF first_name, last_name, email ON "user" BEGIN DELETE FROM search_index WHERE rowid = old.id * 4 + 1; INSERT INTO search_index (rowid, title, detail) VALUES (new.id * 4 + 1, new.first_name || \' \' || new.last_name, new.email); END',
+    'CREATE TRIGGER IF NOT EXISTS user_search_delete AFTER DELETE ON "user" BEGIN DELETE FROM search_index WHERE rowid = old.id * 4 + 1; END',
+    'INSERT INTO search_index (rowid, title, detail) SELECT id * 4 + 2, "class".name, \'\' FROM "class"',
+    'CREATE TRIGGER IF NOT EXISTS class_search_insert AFTER INSERT ON "class" BEGIN INSERT INTO search_index (rowid, title, detail) VALUES (new.id * 4 + 2, new.name, \'\'); END',
+    'CREATE TRIGGER IF NOT EXISTS class_search_update AFTER UPDATE OF name ON "class" BEGIN DELETE FROM search_index WHERE rowid = old.id * 4 + 2; INSERT INTO search_index (rowid, title, detail) VALUES (new.id * 4 + 2, new.name, \'\'); END',
+    'CREATE TRIGGER IF NOT EXISTS class_search_delete AFTER DELETE ON "class" BEGIN DELETE FROM search_index WHERE rowid = old.id * 4 + 2; END',
+]
+
+
+def upgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for statement in STATEMENTS:
+        op.execute(statement)
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'sqlite':
+        return
+    for table in ('student', 'user', 'class'):
+        for action in ('insert', 'update', 'delete'):
+            op.execute(f'DROP TRIGGER IF EXISTS {table}_search_{action}')
+    op.execute('DROP TABLE IF EXISTS search_index')
@@ -0,0 +1,84 @@
+"""Shared fixtures: a throwaway database, synthetic schools, logged-in clients and statement counters.
+
+The tests run against one app built by create_app with a temporary database and
+the settings that keep them fast and deterministic.
+"""
+import contextlib
+import os
+import tempfile
+
+import pytest
+
+from sqlalchemy import event
+from werkzeug.security import generate_password_hash
+
+from app import create_app, db, identity_cache, rebuild_grade_summaries, response_cache
+from benchmarks.synthetic import generate_school
+
+PASSWORD = 'secret'
+DATABASE_DIR = tempfile.mkdtemp(prefix='academex-tests-')
+
+flask_app = create_app({
+    'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(DATABASE_DIR, 'school.db'),
+    'RESPONSE_CACHE_ENABLED': False,
+    # Queued jobs stay in the table, so a test sees exactly the statements its request ran
+    'JOBS_WORKERS': 0,
+    'PASSWORD_HASH_METHOD': 'pbkdf2:sha256:1000',
+    'TENANT_DATABASE_URI': 'sqlite:///' + os.path.join(DATABASE_DIR, 'tenants', '{tenant}.db'),
+})
+# Uploads and school databases land in the temporary folder too, not in the project's instance folder
+flask_app.instance_path = DATABASE_DIR
+
+
+@pytest.fixture
+def app():
+    """The application over an empty database, rebuilt for every test."""
+    with flask_app.app_context():
+        db.drop_all()
+        db.create_all()
+        # User ids repeat between tests, so nothing remembered about an earlier user may survive
+        identity_cache.clear()
+        response_cache.backend.clear()
+    yield flask_app
+    with flask_app.app_context():
+        db.session.remove()
+
+
+@pytest.fixture
+def make_school(app):
+    """Fill the database with a synthetic school and return the first id of each table."""
+    def make(classes=2, students_per_class=5, courses=3):
+        with app.app_context():
+            password_hash = generate_password_hash(PASSWORD, app.config['PASSWORD_HASH_METHOD'])
+            with db.session.get_bind().begin() as connection:
+                counts = generate_school(connection, classes=classes, students_per_class=students_per_class,
+                                         courses=courses, password_hash=password_hash)
+            rebuild_grade_summaries()
+        return counts['first_ids']
+    return make
+
+
+def login(client, email, password=PASSWORD):
+    response = client.post('/login', data={'email': email, 'password': password})
+    assert response.status_code == 302, response.status_code
+    return client
+
+
+@pytest.fixture
+def count_queries(app):
+    """Context manager collecting every SQL statement sent while it is open."""
+    @contextlib.contextmanager
+    def counting():
+        statements = []
+
+        def before_cursor_execute(connection, cursor, statement, *args):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.session.get_bind()
+        event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+    return counting
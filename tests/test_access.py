@@ -0,0 +1,76 @@
+"""Pages that change or reveal school-wide data are only open to the roles that own them."""
+import io
+
+from app import Class, Student, Teacher, User
+from conftest import login
+
+
+def user_email(app, role):
+    with app.app_context():
+        if role == 'Teacher':
+            return Teacher.query.join(Class).order_by(Teacher.id).first().user.email
+        return User.query.filter_by(role=role).order_by(User.id).first().email
+
+
+def student_count(app):
+    with app.app_context():
+        return Student.query.count()
+
+
+def upload(rows):
+    return {'file': (io.BytesIO(rows.encode()), 'pupils.csv')}
+
+
+def test_import_students_needs_login(app, make_school):
+    make_school()
+    before = student_count(app)
+    response = app.test_client().post('/import_students', data=upload('admission_number,name\nX-1,Intruder\n'))
+    assert response.status_code == 401
+    assert student_count(app) == before
+
+
+def test_import_students_is_admin_only(app, make_school):
+    make_school()
+    before = student_count(app)
+    client = login(app.test_client(), user_email(app, 'Teacher'))
+    assert client.get('/import_students').status_code == 302
+    response = client.post('/import_students', data=upload('admission_number,name\nX-1,Intruder\n'))
+    assert response.status_code == 302
+    assert student_count(app) == before
+
+
+def test_import_job_is_not_shown_to_anonymous_users(app, make_school):
+    make_school()
+    client = login(app.test_client(), user_email(app, 'Admin'))
+    response = client.post('/import_students', data=dict(upload('admission_number,name\nX-1,Pupil\n'),
+                                                         idempotency_key='one'))
+    job_url = response.headers['Location']
+    assert 'job=' in job_url
+    assert 'Import job' in client.get(job_url).get_data(as_text=True)
+    assert app.test_client().get(job_url).status_code == 401
+
+
+def test_parents_cannot_list_admission_numbers(app, make_school):
+    make_school()
+    client = login(app.test_client(), user_email(app, 'Parent'))
+    response = client.get('/search?kind=student&q=ADM0&limit=50')
+    assert response.status_code == 403
+    assert 'results' not in response.get_json()
+
+
+def test_metrics_and_cache_stats_are_admin_only(app, make_school):
+    make_school()
+    for path in ('/metrics', '/metrics/profiles', '/cache_stats'):
+        assert app.test_client().get(path).status_code in (401, 403)
+        teacher = login(app.test_client(), user_email(app, 'Teacher'))
+        assert teacher.get(path).status_code == 403
+        admin = login(app.test_client(), user_email(app, 'Admin'))
+        assert admin.get(path).status_code == 200
+
+
+def test_metrics_scraper_is_recognised_by_address(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'METRICS_ALLOW_FROM', '10.0.0.0/8, 192.0.2.7')
+    client = app.test_client()
+    assert client.get('/metrics', environ_base={'REMOTE_ADDR': '10.1.2.3'}).status_code == 200
+    assert client.get('/metrics', environ_base={'REMOTE_ADDR': '192.0.2.7'}).status_code == 200
+    assert client.get('/metrics', environ_base={'REMOTE_ADDR': '192.0.2.8'}).status_code == 403
@@ -0,0 +1,52 @@
+"""Keyset pagination of the JSON API visits every row exactly once, whatever the sort column."""
+import pytest
+
+from app import AssociationRequest, Parent, Student, User, db
+from conftest import login
+
+
+@pytest.mark.parametrize('order', ['asc', 'desc'])
+@pytest.mark.parametrize('sort', ['id', 'name', 'class_id', 'parent_id'])
+def test_student_pages_cover_every_student(app, make_school, sort, order):
+    make_school(classes=2, students_per_class=6)
+    with app.app_context():
+        # Students without a class or parent put NULLs in the middle of the sort
+        db.session.add_all([Student(admission_number=f'LOOSE{number}', name=f'Loose {number}')
+                            for number in range(4)])
+        db.session.commit()
+        expected = sorted(student_id for (student_id,) in db.session.query(Student.id))
+        email = User.query.filter_by(role='Admin').first().email
+    client = login(app.test_client(), email)
+
+    seen, url = [], f'/api/v1/students?sort={sort}&order={order}&page_size=3'
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        body = response.get_json()
+        seen += [row['id'] for row in body['data']]
+        url = body['next'] and f'/api/v1/students?sort={sort}&order={order}&page_size=3&after={body["next"]}'
+    assert sorted(seen) == expected
+
+
+@pytest.mark.parametrize('status', ['pending', 'declined'])
+def test_parent_only_reads_accepted_children(app, make_school, status):
+    make_school(classes=1, students_per_class=6)
+    with app.app_context():
+        accepted = AssociationRequest.query.filter_by(status='accepted').order_by(AssociationRequest.id).first()
+        parent = accepted.parent
+        email = parent.user.email
+        # Another family's child, requested by this parent but not (or no longer) accepted
+        other = Student.query.filter(~Student.id.in_(
+            db.session.query(AssociationRequest.student_id).filter_by(parent_id=parent.id))).first()
+        db.session.add(AssociationRequest(parent_id=parent.id, student_id=other.id, status=status))
+        other.parent_id = parent.id
+        db.session.commit()
+        other_id, accepted_id = other.id, accepted.student_id
+    client = login(app.test_client(), email)
+
+    for url in (f'/api/v1/students/{other_id}', f'/api/v1/students/{other_id}/summary',
+                f'/api/v1/students/{other_id}/attendance?to=2026-01-05'):
+        assert client.get(url).status_code == 404, url
+    assert client.get(f'/api/v1/grades?student_id={other_id}').get_json()['data'] == []
+    # The accepted child stays readable
+    assert client.get(f'/api/v1/students/{accepted_id}').status_code == 200
@@ -0,0 +1,45 @@
+"""Accepting every request at once only covers the requests the teacher has been shown."""
+import re
+
+from app import AssociationRequest, Class, Parent, Student, Teacher, db, teacher_student_ids
+from conftest import login
+
+
+def pending_ids(teacher_id):
+    return sorted(request_id for (request_id,) in db.session.query(AssociationRequest.id).filter(
+        AssociationRequest.status == 'pending',
+        AssociationRequest.student_id.in_(teacher_student_ids(teacher_id))))
+
+
+def test_accept_all_stops_at_the_last_request_shown(app, make_school):
+    make_school(classes=1, students_per_class=12)
+    with app.app_context():
+        teacher = Teacher.query.join(Class).first()
+        teacher_id, email = teacher.id, teacher.user.email
+        # Every student of the class gets a pending request, so there are several pages
+        parent = Parent.query.first()
+        db.session.query(AssociationRequest).delete()
+        db.session.add_all([AssociationRequest(parent_id=parent.id, student_id=student.id)
+                            for student in Student.query.filter_by(class_id=teacher.classes[0].id)])
+        db.session.commit()
+        before = pending_ids(teacher_id)
+    client = login(app.test_client(), email)
+
+    page = client.get('/view_and_manage_association_requests?page_size=5').get_data(as_text=True)
+    through_id = int(re.search(r'name="through_id" value="(\d+)"', page).group(1))
+    assert through_id == before[4]
+    assert 'Accept all 5 shown so far' in page
+
+    # A request that arrives after the page was rendered
+    with app.app_context():
+        late = AssociationRequest(parent_id=Parent.query.order_by(Parent.id.desc()).first().id,
+                                  student_id=Student.query.first().id)
+        db.session.add(late)
+        db.session.commit()
+        late_id = late.id
+
+    response = client.post('/view_and_manage_association_requests',
+                           data={'action': 'accept', 'scope': 'all', 'through_id': through_id, 'order': 'asc'})
+    assert response.status_code == 302
+    with app.app_context():
+        assert pending_ids(teacher_id) == before[5:] + [late_id]
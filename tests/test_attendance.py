@@ -0,0 +1,26 @@
+"""A roll call posted as JSON saves the valid marks and reports the others."""
+import pytest
+
+from app import AttendanceRecord, Class, Teacher
+from conftest import login
+
+
+@pytest.mark.parametrize('status', [['P'], {'code': 'P'}, 7, None, 'Z'])
+def test_malformed_status_is_reported(app, make_school, status):
+    make_school()
+    with app.app_context():
+        teacher = Teacher.query.join(Class).order_by(Teacher.id).first()
+        email = teacher.user.email
+        class_ = teacher.classes[0]
+        marked, other = [student.id for student in class_.students[:2]]
+    client = login(app.test_client(), email)
+
+    response = client.post('/take_attendance', json={
+        'class_id': class_.id, 'date': '2026-01-05', 'period': 1,
+        'marks': [{'student_id': marked, 'status': 'A'}, {'student_id': other, 'status': status}]})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['saved'] == 1
+    assert body['errors'] == [f'Student {other}: unknown attendance status {status!r}.']
+    with app.app_context():
+        assert [(record.student_id, record.status) for record in AttendanceRecord.query] == [(marked, 'A')]
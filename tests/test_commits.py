@@ -0,0 +1,100 @@
+"""Every write route applies its changes as a single unit of work: one commit per request."""
+import contextlib
+
+import pytest
+from sqlalchemy import event
+
+from app import AssociationRequest, Class, Course, Enrollment, Parent, Student, Teacher, User, db
+from conftest import login
+
+
+@pytest.fixture
+def count_commits(app):
+    @contextlib.contextmanager
+    def counting():
+        commits = []
+
+        def after_commit(session):
+            commits.append(session)
+
+        event.listen(db.session, 'after_commit', after_commit)
+        try:
+            yield commits
+        finally:
+            event.remove(db.session, 'after_commit', after_commit)
+    return counting
+
+
+@pytest.fixture(params=[True, False], ids=['jobs', 'inline'])
+def school(request, app, make_school, monkeypatch):
+    # Derived work either rides along as a queued job or runs inside the same commit
+    monkeypatch.setitem(app.config, 'JOBS_ENABLED', request.param)
+    make_school()
+    with app.app_context():
+        teacher = Teacher.query.join(Class).order_by(Teacher.id).first()
+        parent = Parent.query.order_by(Parent.id).first()
+        pupils = Student.query.filter_by(class_id=teacher.classes[0].id).all()
+        return {
+            'admin': User.query.filter_by(role='Admin').order_by(User.id).first().email,
+            'teacher': teacher.user.email,
+            'teacher_id': teacher.id,
+            'parent': parent.user.email,
+            'class_id': teacher.classes[0].id,
+            'unrequested': Student.query.filter(~Student.id.in_(
+                db.session.query(AssociationRequest.student_id).filter_by(parent_id=parent.id)
+            )).order_by(Student.id).first().admission_number,
+            'cells': [{'student_id': pupil.id, 'course_id': enrollment.course_id, 'grade': 42.5}
+                      for pupil in pupils for enrollment in Enrollment.query.filter_by(student_id=pupil.id)],
+        }
+
+
+def test_register_commits_once(app, school, count_commits):
+    client = app.test_client()
+    form = {'first_name': 'New', 'last_name': 'Parent', 'email': 'new.parent@example.school',
+            'password': 'secret', 'role': 'Parent'}
+    with count_commits() as commits:
+        assert client.post('/register', data=form).status_code == 302
+    assert len(commits) == 1
+
+
+def test_send_association_request_commits_once(app, school, count_commits):
+    client = login(app.test_client(), school['parent'])
+    with count_commits() as commits:
+        response = client.post('/send_association_request',
+                               data={'student_admission_number': school['unrequested']})
+    assert response.status_code == 302
+    assert len(commits) == 1
+
+
+def test_add_course_commits_once(app, school, count_commits):
+    client = login(app.test_client(), school['admin'])
+    with count_commits() as commits:
+        assert client.post('/add_course', data={'name': 'Astronomy'}).status_code == 302
+    assert len(commits) == 1
+    with app.app_context():
+        assert Course.query.filter_by(name='Astronomy').count() == 1
+
+
+def test_add_class_commits_once(app, school, count_commits):
+    client = login(app.test_client(), school['admin'])
+    with count_commits() as commits:
+        response = client.post('/add_class', data={'name': 'Form 9Z', 'teacher': school['teacher_id']})
+    assert response.status_code == 302
+    assert len(commits) == 1
+
+
+def test_add_student_commits_once(app, school, count_commits):
+    client = login(app.test_client(), school['admin'])
+    form = {'admission_number': 'NEW0001', 'student_name': 'New Pupil', 'class_id': school['class_id']}
+    with count_commits() as commits:
+        assert client.post('/add_student', data=form).status_code == 302
+    assert len(commits) == 1
+
+
+def test_grade_batch_commits_once(app, school, count_commits):
+    client = login(app.test_client(), school['teacher'])
+    with count_commits() as commits:
+        response = client.post('/add_grades', json={'grades': school['cells']})
+    assert response.status_code == 200
+    assert response.get_json()['saved'] == len(school['cells'])
+    assert len(commits) == 1
@@ -0,0 +1,27 @@
+"""Course summaries aggregated in SQL agree with summarize_grades over the same grades."""
+import json
+
+import pytest
+
+from app import Course, Enrollment, Grade, GradeSummary, db, insert, refresh_course_summaries, summarize_grades
+
+
+def test_course_summaries_match_python_aggregates(app, make_school):
+    make_school(classes=3, students_per_class=7)
+    with app.app_context():
+        # Grades on the edges of the range and of the distribution buckets
+        db.session.execute(insert(Grade), [{'enrollment_id': 1, 'grade': grade} for grade in (0, 10, 30, 99.99, 100)])
+        course_ids = [course_id for (course_id,) in db.session.query(Course.id)]
+        refresh_course_summaries(course_ids)
+        db.session.commit()
+
+        for course_id in course_ids:
+            grades = [grade for (grade,) in db.session.query(Grade.grade).join(Enrollment).filter(
+                Enrollment.course_id == course_id)]
+            expected = summarize_grades(grades)
+            summary = GradeSummary.query.filter_by(scope='course', scope_id=course_id).one()
+            assert summary.grade_count == expected['grade_count']
+            assert summary.mean == pytest.approx(expected['mean'])
+            assert summary.median == pytest.approx(expected['median'])
+            assert (summary.min_grade, summary.max_grade) == (expected['min_grade'], expected['max_grade'])
+            assert json.loads(summary.distribution) == json.loads(expected['distribution'])
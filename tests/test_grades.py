@@ -0,0 +1,46 @@
+"""The grade grid posts every cell back; only the cells a teacher changed are written."""
+import re
+
+from app import Class, Enrollment, Grade, Teacher, db
+from conftest import login
+
+
+def grid_cells(html):
+    return dict(re.findall(r'name="(grade-\d+-\d+)" value="([^"]*)"', html))
+
+
+def test_resubmitted_grid_writes_nothing(app, make_school, count_queries):
+    make_school()
+    with app.app_context():
+        teacher = Teacher.query.join(Class).order_by(Teacher.id).first()
+        email = teacher.user.email
+    client = login(app.test_client(), email)
+    cells = grid_cells(client.get('/add_grades').get_data(as_text=True))
+    assert cells
+
+    with count_queries() as statements:
+        response = client.post('/add_grades', data=cells)
+    assert response.status_code == 302
+    assert not [statement for statement in statements if statement.startswith(('INSERT', 'UPDATE'))]
+
+    field = next(iter(cells))
+    cells[field] = '12.5' if cells[field] != '12.5' else '13.5'
+    response = client.post('/add_grades', data=cells, follow_redirects=True)
+    assert '1 grade(s) saved' in response.get_data(as_text=True)
+    _, student_id, course_id = field.split('-')
+    with app.app_context():
+        latest = db.session.query(Grade.grade).join(Enrollment).filter(
+            Enrollment.student_id == int(student_id), Enrollment.course_id == int(course_id)
+        ).order_by(Grade.id.desc()).limit(1).scalar()
+    assert latest == float(cells[field])
+
+
+def test_grade_batch_without_a_list_is_rejected(app, make_school):
+    make_school()
+    with app.app_context():
+        email = Teacher.query.join(Class).order_by(Teacher.id).first().user.email
+    client = login(app.test_client(), email)
+    for body in ({'grades': 5}, {'grades': {'student_id': 1}}, [1, 2], 'grades'):
+        response = client.post('/add_grades', json=body)
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
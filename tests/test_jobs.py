@@ -0,0 +1,56 @@
+"""Background job handlers clean up after themselves, and a job left by a dead worker is not run forever."""
+import datetime
+import os
+import time
+
+import pytest
+
+from app import Job, db, import_students_job, job_queue, utcnow
+
+
+def test_failed_import_removes_its_upload(app, tmp_path):
+    path = tmp_path / 'broken.csv'
+    path.write_bytes(b'\xff\xfe not utf-8 \xff')
+    with app.app_context(), pytest.raises(UnicodeDecodeError):
+        import_students_job(str(path), 'csv')
+    assert not os.path.exists(path)
+
+
+def running_job(attempts, max_attempts, started_seconds_ago):
+    started_at = utcnow() - datetime.timedelta(seconds=started_seconds_ago)
+    job = Job(kind='noop', status='running', attempts=attempts, max_attempts=max_attempts,
+              created_at=started_at, run_after=started_at, started_at=started_at)
+    db.session.add(job)
+    db.session.commit()
+    return job.id
+
+
+def test_abandoned_job_runs_again_only_while_it_has_attempts_left(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'JOBS_STALE_AFTER', 60)
+    with app.app_context():
+        exhausted = running_job(attempts=3, max_attempts=3, started_seconds_ago=120)
+        retried = running_job(attempts=1, max_attempts=3, started_seconds_ago=120)
+        busy = running_job(attempts=1, max_attempts=3, started_seconds_ago=10)
+
+        assert job_queue.claim() == retried
+        assert job_queue.claim() is None
+        db.session.expire_all()
+        assert db.session.get(Job, exhausted).status == 'failed'
+        assert db.session.get(Job, retried).attempts == 2
+        assert db.session.get(Job, busy).attempts == 1
+
+
+def test_long_job_keeps_its_claim_fresh(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'JOBS_STALE_AFTER', 0.15)
+    monkeypatch.setitem(job_queue.handlers, 'slow', lambda: time.sleep(0.3))
+    with app.app_context():
+        job = Job(kind='slow', max_attempts=1, created_at=utcnow(), run_after=utcnow())
+        db.session.add(job)
+        db.session.commit()
+        job_id = job_queue.claim()
+        claimed_at = db.session.get(Job, job_id).started_at
+        job_queue.run(job_id)
+        db.session.expire_all()
+        job = db.session.get(Job, job_id)
+        assert job.status == 'succeeded'
+        assert job.started_at > claimed_at
@@ -0,0 +1,41 @@
+"""Each page runs a fixed number of SQL statements, however large the school is.
+
+A change that reintroduces a per-row query makes the larger school run more
+statements than the expected count and fails here.
+"""
+import pytest
+
+from app import Class, Teacher, User
+from conftest import login
+
+SCHOOL_SIZES = [(2, 5), (6, 20)]
+
+# (role, url, statements run by one request once the user is logged in). Each count
+# includes the one load_user query for the user and their role row: IDENTITY_CACHE_TTL
+# is 0 by default, so no request takes the user from the identity cache.
+PAGES = [
+    ('admin', '/manage_classes', 2),
+    ('teacher', '/teacher_dashboard', 3),
+    ('teacher', '/view_students', 3),
+    ('teacher', '/add_grades', 5),
+    ('teacher', '/view_and_manage_association_requests', 4),
+]
+
+
+@pytest.mark.parametrize('classes, students_per_class', SCHOOL_SIZES)
+@pytest.mark.parametrize('role, url, expected', PAGES)
+def test_page_query_count(app, make_school, count_queries, classes, students_per_class, role, url, expected):
+    make_school(classes=classes, students_per_class=students_per_class)
+    with app.app_context():
+        if role == 'admin':
+            email = User.query.filter_by(role='Admin').order_by(User.id).first().email
+        else:
+            email = Teacher.query.join(Class).order_by(Teacher.id).first().user.email
+    client = login(app.test_client(), email)
+    # A first, uncounted request keeps one-off work such as opening the connection out of the count
+    assert client.get(url).status_code == 200
+
+    with count_queries() as statements:
+        response = client.get(url)
+    assert response.status_code == 200
+    assert len(statements) == expected, statements
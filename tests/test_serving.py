@@ -0,0 +1,32 @@
+"""The app factory and the production server settings."""
+import os
+import runpy
+
+import pytest
+
+from app import create_app
+from conftest import flask_app
+
+
+@pytest.mark.parametrize('workers, backend, cache_enabled', [
+    ('1', 'local', None),
+    ('3', 'local', 'false'),
+    ('3', 'redis', None),
+])
+def test_local_page_cache_is_off_with_several_workers(monkeypatch, workers, backend, cache_enabled):
+    monkeypatch.setenv('WEB_CONCURRENCY', workers)
+    monkeypatch.setenv('FLASK_RESPONSE_CACHE_BACKEND', backend)
+    monkeypatch.delenv('FLASK_RESPONSE_CACHE_ENABLED', raising=False)
+    runpy.run_path(os.path.join(os.path.dirname(__file__), os.pardir, 'gunicorn.conf.py'))
+    assert os.environ.get('FLASK_RESPONSE_CACHE_ENABLED') == cache_enabled
+
+
+def test_create_app_builds_a_separate_app_with_its_own_settings(tmp_path):
+    other = create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + str(tmp_path / 'other.db'),
+                        'METRICS_ENABLED': False, 'JOBS_WORKERS': 0})
+    assert other is not flask_app
+    assert not other.config['METRICS_ENABLED'] and flask_app.config['METRICS_ENABLED']
+    assert {rule.endpoint for rule in other.url_map.iter_rules()} == \
+        {rule.endpoint for rule in flask_app.url_map.iter_rules()}
+    assert other.test_client().get('/healthz').status_code == 200
+    assert other.test_client().get('/metrics').status_code == 404
@@ -0,0 +1,114 @@
+"""Schools served from one deployment never see each other's data, logins or jobs."""
+import json
+
+import pytest
+from flask.testing import FlaskClient
+from werkzeug.security import generate_password_hash
+
+from app import Enrollment, Job, Student, User, db, defer, job_queue, tenant_context, tenant_names
+from benchmarks.synthetic import generate_school
+from conftest import PASSWORD, flask_app, login
+
+SCHOOLS = ('north', 'south')
+
+
+class SchoolClient(FlaskClient):
+    """Test client whose requests go to one host, like a browser on a school's subdomain."""
+
+    host = None
+
+    def open(self, *args, **kwargs):
+        kwargs.setdefault('base_url', f'http://{self.host}')
+        return super().open(*args, **kwargs)
+
+
+def school_client(host):
+    client = SchoolClient(flask_app, flask_app.response_class, use_cookies=True)
+    client.host = host
+    return client
+
+
+@pytest.fixture(scope='module')
+def schools():
+    # Each school's database is created by its migrations, then filled with its own synthetic school
+    result = flask_app.test_cli_runner().invoke(
+        args=['upgrade-schools'] + [option for school in SCHOOLS for option in ('--school', school)])
+    assert result.exit_code == 0, result.output
+    admins = {}
+    with flask_app.app_context():
+        password_hash = generate_password_hash(PASSWORD, flask_app.config['PASSWORD_HASH_METHOD'])
+        for number, school in enumerate(SCHOOLS):
+            with tenant_context(school):
+                with db.session.get_bind().begin() as connection:
+                    generate_school(connection, classes=1, students_per_class=3, password_hash=password_hash,
+                                    seed=number + 1)
+                db.session.add(Student(admission_number=f'ONLY-{school.upper()}', name=f'Pupil of {school}'))
+                db.session.commit()
+                admins[school] = User.query.filter_by(role='Admin').order_by(User.id).first().email
+                db.session.remove()
+    return admins
+
+
+@pytest.fixture
+def tenants(app, schools, monkeypatch):
+    monkeypatch.setitem(app.config, 'TENANTS_ENABLED', True)
+    return schools
+
+
+def test_schools_are_found_by_their_databases(tenants):
+    with flask_app.app_context():
+        assert tenant_names() == sorted(SCHOOLS)
+
+
+def test_data_and_search_stay_within_a_school(tenants):
+    for school in SCHOOLS:
+        client = login(school_client(f'{school}.academex.example'), tenants[school])
+        for other in SCHOOLS:
+            results = client.get(f'/search?q=Pupil of {other}').get_json()['results']
+            labels = [result['label'] for result in results]
+            assert (f'Pupil of {other}' in labels) == (other == school)
+
+
+def test_a_login_only_counts_at_its_own_school(tenants):
+    north = login(school_client('north.academex.example'), tenants['north'])
+    assert north.get('/search?q=Pupil').status_code == 200
+
+    south = school_client('south.academex.example')
+    cookie = north.get_cookie('session', domain='north.academex.example')
+    south.set_cookie('session', cookie.value, domain='south.academex.example')
+    assert south.get('/search?q=Pupil').status_code in (302, 401)
+
+
+def test_unknown_school_is_not_found(tenants):
+    client = school_client('nowhere.academex.example')
+    assert client.get('/login').status_code == 404
+    # The probes answer for the deployment on any host
+    assert client.get('/healthz').status_code == 200
+
+
+def test_metrics_of_every_school_are_not_shown_to_a_school_admin(tenants):
+    assert school_client('academex.example').get('/metrics').status_code == 403
+    north = login(school_client('north.academex.example'), tenants['north'])
+    assert north.get('/metrics').status_code == 403
+    assert north.get('/metrics/profiles').status_code == 403
+
+
+def test_each_school_runs_its_own_jobs(tenants, monkeypatch):
+    monkeypatch.setattr(job_queue, 'tenants', tenant_names)
+    with flask_app.app_context():
+        for school in SCHOOLS:
+            with tenant_context(school):
+                Job.query.delete()
+                enrollment_id = db.session.query(db.func.min(Enrollment.id)).scalar()
+                defer('refresh_grade_summaries', {'enrollment_ids': [enrollment_id]})
+                db.session.commit()
+                db.session.remove()
+
+        assert job_queue.run_pending() == len(SCHOOLS)
+
+        for school in SCHOOLS:
+            with tenant_context(school):
+                jobs = Job.query.all()
+                assert [(job.kind, job.status) for job in jobs] == [('refresh_grade_summaries', 'succeeded')]
+                assert json.loads(jobs[0].result) == {'enrollments': 1}
+                db.session.remove()